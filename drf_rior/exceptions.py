@@ -1,19 +1,41 @@
-import inspect
+import sys
+from typing import Optional
 
 
 class ClassDefinitionError(Exception):
     """
     Base class for errors related to conflicts in the class definition when
     instantiating or using an object of a class.
+    The caller information is captured on creation, but the message is only
+    formatted when it is used.
     """
 
     def __init__(self, message: str):
-        stack = inspect.stack()[1][0]
-        frame_info = inspect.getframeinfo(stack)
-        caller = f"{frame_info.function}:{frame_info.lineno}"
-        if class_name := stack.f_locals.get("self", ""):
-            caller = f"{class_name}.{caller}"
-        self.caller = caller
+        frame = sys._getframe(1)
+        try:
+            self._function = frame.f_code.co_name
+            self._lineno = frame.f_lineno
+            self._owner: Optional[type] = None
+            if "self" in frame.f_locals:
+                self._owner = type(frame.f_locals["self"])
+            elif isinstance(frame.f_locals.get("cls"), type):
+                self._owner = frame.f_locals["cls"]
+        finally:
+            del frame
 
-        self.message = f"{message}\nOccurred in: {caller}"
-        super().__init__(self.message)
+        self._message = message
+        super().__init__(message)
+
+    @property
+    def caller(self) -> str:
+        caller = f"{self._function}:{self._lineno}"
+        if self._owner is not None:
+            caller = f"{self._owner.__name__}.{caller}"
+        return caller
+
+    @property
+    def message(self) -> str:
+        return f"{self._message}\nOccurred in: {self.caller}"
+
+    def __str__(self) -> str:
+        return self.message
@@ -1,8 +1,10 @@
 from typing import Optional, Type
 
-from rest_framework import serializers, viewsets, status
+from rest_framework import serializers, viewsets
+from rest_framework.status import HTTP_204_NO_CONTENT, is_success
 
 from drf_rior.exceptions import ClassDefinitionError
+from drf_rior.serializers import ResultWrapperSerializer
 from drf_rior.utils import SerializerActionViewGroup
 
 
@@ -30,20 +32,42 @@ class GenericViewSet(viewsets.GenericViewSet):
         1. action_serializer_group[`action`].SPECIFIC_TYPE
         2. action_serializer_group[`action`].DEFAUlT
         3. serializer_class attr
+
+    `action_serializer_group` and `serializer_class` are validated when a subclass
+    that declares `action_serializer_group` is defined. Subclasses that do not
+    declare it, like shared base classes, raise only when instantiated.
     """
 
     action_serializer_group: dict[str, SerializerActionViewGroup]
+    # Marks views handled by drf_rior.schema.RequestResponseAutoSchema.
+    _is_rior_view = True
+    # Error raised on instantiation for classes without action_serializer_group.
+    _definition_error: Optional[str] = "action_serializer_group must be declared."
 
-    def __init__(self, **kwargs):
-        if getattr(self, "action_serializer_group", None) is None:
-            raise ClassDefinitionError("action_serializer_group must be declared.")
+    def __init_subclass__(cls, **kwargs):
+        """
+        Validates the class definition once, when the subclass is defined.
+        Classes that do not declare `action_serializer_group` are not validated
+        here, so shared base classes can be defined, but they can't be instantiated.
+        """
+        super().__init_subclass__(**kwargs)
+        action_serializer_group = getattr(cls, "action_serializer_group", None)
+        if action_serializer_group is None:
+            cls._definition_error = "action_serializer_group must be declared."
+            return
 
-        if not isinstance(self.action_serializer_group, dict):
+        if not isinstance(action_serializer_group, dict):
             raise ClassDefinitionError("action_serializer_group must be a dict.")
 
-        if not self.serializer_class:
+        if not cls.serializer_class:
             raise ClassDefinitionError("serializer_class must be declared.")
 
+        cls._definition_error = None
+
+    def __init__(self, **kwargs):
+        if self._definition_error:
+            raise ClassDefinitionError(self._definition_error)
+
         super().__init__(**kwargs)
         self.response = None
 
@@ -118,60 +142,87 @@ class GenericViewSet(viewsets.GenericViewSet):
     def get_serializer(self, *args, **kwargs) -> serializers.Serializer:
         """
         Gets the default serializer to be used based on the group for the
-        action of the view, adding the context.
+        action of the view, adding the context if not provided.
         :return: serializer class to be used.
         """
         serializer_class = self.get_serializer_class()
-        kwargs["context"] = self.get_serializer_context()
+        kwargs.setdefault("context", self.get_serializer_context())
         return serializer_class(*args, **kwargs)
 
     def get_request_serializer(self, *args, **kwargs) -> serializers.Serializer:
         """
         Gets the request serializer to be used based on the group for the
-        action of the view, adding the context.
+        action of the view, adding the context if not provided.
         :return: serializer class to be used.
         """
         serializer_class = self.get_request_serializer_class()
-        kwargs["context"] = self.get_serializer_context()
+        kwargs.setdefault("context", self.get_serializer_context())
         return serializer_class(*args, **kwargs)
 
     def get_input_serializer(self, *args, **kwargs) -> serializers.Serializer:
         """
         Gets the input serializer to be used based on the group for the
-        action of the view, adding the context.
+        action of the view, adding the context if not provided.
         :return: serializer class to be used.
         """
         serializer_class = self.get_input_serializer_class()
-        kwargs["context"] = self.get_serializer_context()
+        kwargs.setdefault("context", self.get_serializer_context())
         return serializer_class(*args, **kwargs)
 
     def get_output_serializer(self, *args, **kwargs) -> serializers.Serializer:
         """
         Gets the output serializer to be used based on the group for the
-        action of the view, adding the context.
+        action of the view, adding the context if not provided.
         :return: serializer class to be used.
         """
         serializer_class = self.get_output_serializer_class()
-        kwargs["context"] = self.get_serializer_context()
+        kwargs.setdefault("context", self.get_serializer_context())
         return serializer_class(*args, **kwargs)
 
     def get_response_serializer(self, *args, **kwargs) -> serializers.Serializer:
         """
         Gets the response serializer to be used based on the group for the
-        action of the view, adding the context.
+        action of the view, adding the context if not provided.
         :return: serializer class to be used.
         """
-        serializer_class = self.get_response_serializer_class()
-        kwargs["context"] = {"response": self.response, **self.get_serializer_context()}
+        return self._build_response_serializer(
+            self.get_response_serializer_class(), *args, **kwargs
+        )
+
+    def _build_response_serializer(
+        self, serializer_class: Type[serializers.Serializer], *args, **kwargs
+    ) -> serializers.Serializer:
+        """
+        Instantiates `serializer_class` as the response serializer, adding the
+        response to the provided context, or to the view context if not provided.
+        :return: serializer to be used.
+        """
+        if (context := kwargs.get("context")) is None:
+            context = self.get_serializer_context()
+        kwargs["context"] = {"response": self.response, **context}
         return serializer_class(*args, **kwargs)
 
     def finalize_response(self, request, response, *args, **kwargs):
+        """
+        Wraps the data of successful responses using the response serializer.
+        Responses with no content and error responses are returned unchanged.
+        The response serializer class is resolved once, with
+        `get_response_serializer_class`.
+        """
         finalized_response = super().finalize_response(
             request, response, *args, **kwargs
         )
         self.response = finalized_response
-        if self.response.status_code == status.HTTP_204_NO_CONTENT:
+        status_code = self.response.status_code
+        if status_code == HTTP_204_NO_CONTENT or not is_success(status_code):
             return finalized_response
-        response_serializer = self.get_response_serializer({"result": response.data})
+        serializer_class = self.get_response_serializer_class()
+        if issubclass(serializer_class, ResultWrapperSerializer):
+            self.response.data = {"result": response.data}
+            return self.response
+
+        response_serializer = self._build_response_serializer(
+            serializer_class, {"result": response.data}
+        )
         self.response.data = response_serializer.data
         return self.response
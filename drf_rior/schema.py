@@ -1,7 +1,5 @@
 from drf_spectacular.openapi import AutoSchema
 
-from drf_rior.generics import GenericViewSet
-
 
 class RequestResponseAutoSchema(AutoSchema):
     """
@@ -10,11 +8,11 @@ class RequestResponseAutoSchema(AutoSchema):
     """
 
     def get_request_serializer(self):
-        if isinstance(self.view, GenericViewSet):
+        if getattr(self.view, "_is_rior_view", False):
             return self.view.get_request_serializer()
         return self._get_serializer()
 
     def get_response_serializers(self):
-        if isinstance(self.view, GenericViewSet):
+        if getattr(self.view, "_is_rior_view", False):
             return self.view.get_response_serializer()
         return self._get_serializer()
@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+
+class ResultWrapperSerializer(serializers.Serializer):
+    """
+    Wraps the response data of a view in a `result` key.
+    """
+
+    # Views using this serializer as `response` wrap the data directly without
+    # instantiating it, so `result` only documents the data in the schema.
+    # Subclasses can redeclare it to describe the shape of the data.
+    result = serializers.JSONField(read_only=True)
+
+    def to_representation(self, instance):
+        return instance
@@ -7,7 +7,7 @@ SerializerType = Type[serializers.Serializer]
 OptionalSerializerType = Optional[SerializerType]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SerializerActionViewGroup:
     """
     Used to define the serializers to be used in any action from a view that extends
@@ -0,0 +1,42 @@
+import pytest
+
+from drf_rior.exceptions import ClassDefinitionError
+from drf_rior.generics import GenericViewSet
+
+
+class Owner:
+    def fail(self):
+        raise ClassDefinitionError("method failed.")
+
+
+def test_error_raised_from_method():
+    with pytest.raises(ClassDefinitionError) as exc_info:
+        Owner().fail()
+
+    error = exc_info.value
+    caller = f"Owner.fail:{Owner.fail.__code__.co_firstlineno + 1}"
+    assert error.args == ("method failed.",)
+    assert error.caller == caller
+    assert error.message == f"method failed.\nOccurred in: {caller}"
+    assert str(error) == error.message
+
+
+def test_error_raised_from_init_subclass():
+    with pytest.raises(ClassDefinitionError) as exc_info:
+
+        class ViewSet(GenericViewSet):
+            action_serializer_group = []
+
+    error = exc_info.value
+    assert error.args == ("action_serializer_group must be a dict.",)
+    assert error.caller.startswith("ViewSet.__init_subclass__:")
+    assert str(error) == (
+        f"action_serializer_group must be a dict.\nOccurred in: {error.caller}"
+    )
+
+
+def test_message_is_read_only():
+    error = ClassDefinitionError("failed.")
+
+    with pytest.raises(AttributeError):
+        error.message = "changed."
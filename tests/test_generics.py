@@ -0,0 +1,128 @@
+import pytest
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from drf_rior.exceptions import ClassDefinitionError
+from drf_rior.generics import GenericViewSet
+from drf_rior.utils import SerializerActionViewGroup
+from drf_rior.views import ModelViewSet
+
+
+class DefaultSerializer(serializers.Serializer):
+    name = serializers.CharField()
+
+
+class ResultSerializer(serializers.Serializer):
+    result = serializers.JSONField()
+
+
+class ItemViewSet(GenericViewSet):
+    serializer_class = DefaultSerializer
+    action_serializer_group = {
+        "create": SerializerActionViewGroup(
+            default=DefaultSerializer, response=ResultSerializer
+        ),
+    }
+
+    def create(self, request):
+        input_serializer = self.get_input_serializer(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+        return Response(input_serializer.data, status=201)
+
+
+def test_successful_response_is_wrapped():
+    view = ItemViewSet.as_view({"post": "create"})
+
+    response = view(APIRequestFactory().post("/items/", {"name": "item"}))
+
+    assert response.status_code == 201
+    assert response.data == {"result": {"name": "item"}}
+
+
+def test_error_response_is_not_wrapped():
+    view = ItemViewSet.as_view({"post": "create"})
+
+    response = view(APIRequestFactory().post("/items/", {}))
+
+    assert response.status_code == 400
+    assert set(response.data) == {"name"}
+
+
+def test_subclass_without_action_serializer_group_can_be_defined():
+    class BaseViewSet(GenericViewSet):
+        pagination_class = None
+
+    with pytest.raises(ClassDefinitionError, match="must be declared"):
+        BaseViewSet()
+
+
+def test_model_viewset_subclass_without_action_serializer_group_can_be_defined():
+    class BaseViewSet(ModelViewSet):
+        pass
+
+    with pytest.raises(ClassDefinitionError, match="must be declared"):
+        BaseViewSet()
+
+
+def test_action_serializer_group_must_be_a_dict():
+    with pytest.raises(ClassDefinitionError, match="must be a dict"):
+
+        class ViewSet(GenericViewSet):
+            serializer_class = DefaultSerializer
+            action_serializer_group = [SerializerActionViewGroup(DefaultSerializer)]
+
+
+def test_serializer_class_must_be_declared_with_action_serializer_group():
+    with pytest.raises(ClassDefinitionError, match="serializer_class must be declared"):
+
+        class ViewSet(GenericViewSet):
+            action_serializer_group = {}
+
+
+def test_subclass_of_base_viewset_is_validated():
+    class BaseViewSet(ModelViewSet):
+        pass
+
+    with pytest.raises(ClassDefinitionError, match="must be a dict"):
+
+        class ViewSet(BaseViewSet):
+            serializer_class = DefaultSerializer
+            action_serializer_group = [SerializerActionViewGroup(DefaultSerializer)]
+
+
+def test_serializers_do_not_share_context():
+    view = ItemViewSet(request=None, format_kwarg=None, action="create")
+
+    view.get_input_serializer().context["written"] = True
+
+    assert "written" not in view.get_output_serializer().context
+    assert "written" not in view.get_response_serializer().context
+
+
+@pytest.mark.parametrize(
+    "getter",
+    [
+        "get_serializer",
+        "get_request_serializer",
+        "get_input_serializer",
+        "get_output_serializer",
+        "get_response_serializer",
+    ],
+)
+def test_caller_context_is_kept(getter):
+    view = ItemViewSet(request=None, format_kwarg=None, action="create")
+
+    serializer = getattr(view, getter)(context={"custom": True})
+
+    assert serializer.context["custom"] is True
+    assert "view" not in serializer.context
+
+
+def test_response_is_added_to_caller_context():
+    view = ItemViewSet(request=None, format_kwarg=None, action="create")
+    view.response = Response()
+
+    serializer = view.get_response_serializer(context={"custom": True})
+
+    assert serializer.context == {"custom": True, "response": view.response}
@@ -0,0 +1,60 @@
+from django.urls import include, path
+from drf_spectacular.generators import SchemaGenerator
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.routers import SimpleRouter
+from rest_framework.test import APIRequestFactory
+
+from drf_rior.generics import GenericViewSet
+from drf_rior.schema import RequestResponseAutoSchema
+from drf_rior.serializers import ResultWrapperSerializer
+from drf_rior.utils import SerializerActionViewGroup
+
+
+class ItemSerializer(serializers.Serializer):
+    name = serializers.CharField()
+
+
+class ItemResultSerializer(ResultWrapperSerializer):
+    result = ItemSerializer(read_only=True)
+
+
+class ItemViewSet(GenericViewSet):
+    serializer_class = ItemSerializer
+    action_serializer_group = {
+        "retrieve": SerializerActionViewGroup(
+            default=ItemSerializer, response=ItemResultSerializer
+        ),
+    }
+    schema = RequestResponseAutoSchema()
+
+    def retrieve(self, request, pk=None):
+        return Response({"name": "item"})
+
+
+def test_result_wrapper_response_is_wrapped_without_serializer(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("response serializer should not be created")
+
+    monkeypatch.setattr(ItemViewSet, "get_response_serializer", fail)
+    view = ItemViewSet.as_view({"get": "retrieve"})
+
+    response = view(APIRequestFactory().get("/items/1/"), pk=1)
+
+    assert response.status_code == 200
+    assert response.data == {"result": {"name": "item"}}
+
+
+def test_result_wrapper_schema_documents_result():
+    router = SimpleRouter()
+    router.register("items", ItemViewSet, basename="item")
+    generator = SchemaGenerator(patterns=[path("", include(router.urls))])
+
+    schema = generator.get_schema(request=None, public=True)
+
+    response_schema = schema["paths"]["/items/{id}/"]["get"]["responses"]["200"]
+    component = response_schema["content"]["application/json"]["schema"]["$ref"]
+    properties = schema["components"]["schemas"][component.split("/")[-1]]
+    assert properties["properties"]["result"]["allOf"] == [
+        {"$ref": "#/components/schemas/Item"}
+    ]